@@ -1,10 +1,13 @@
-from collections import defaultdict
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
+# Instances are created by the thousands per page: use __slots__ where dataclasses support it (Python 3.10+)
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class HotCharacter:
     """A hot character is a character on a page with certain attributes.
 
@@ -25,7 +28,7 @@ class HotCharacter:
     is_anno: Optional[bool] = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ElementDimension:
     """ElementDimension is the dimension of an element in hotpdf.
 
@@ -44,7 +47,7 @@ class ElementDimension:
     span_id: Optional[UUID] = None
 
 
-@dataclass(init=True)
+@dataclass(init=True, **_SLOTS)
 class Span:
     """A span is a group of characters that are close to each other.
 
@@ -91,4 +94,4 @@ class Span:
 PageResult = list[list[HotCharacter]]
 
 # Complete PageResult with Page Number as the index
-SearchResult = defaultdict[int, PageResult]
+SearchResult = dict[int, PageResult]
@@ -1,16 +1,17 @@
 import math
 import os
-from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from io import IOBase
+from operator import attrgetter
 from pathlib import PurePath
 from typing import Optional, Union
+from uuid import UUID
 
 from hotpdf import processor
 from hotpdf.exceptions.custom_exceptions import HotPdfIsNoneError
 from hotpdf.memory_map import MemoryMap
-from hotpdf.utils import filter_adjacent_coords, intersect
 
-from .data.classes import ElementDimension, HotCharacter, PageResult, SearchResult, Span
+from .data.classes import HotCharacter, PageResult, SearchResult, Span
 
 
 class HotPdf:
@@ -23,6 +24,7 @@ class HotPdf:
         laparams: Optional[dict[str, Union[float, bool]]] = None,
         include_annotation_spaces: bool = False,
         preserve_pdfminer_coordinates: bool = False,
+        lazy: bool = False,
     ) -> None:
         """Initialize the HotPdf class.
 
@@ -37,13 +39,14 @@ class HotPdf:
             include_annotation_spaces (bool, optional): Add annotation spaces to the memory map. Default: False
             preserve_pdfminer_coordinates (bool, Optional): Preserve pdfminer y-coordinate values.
                 Default: False - use natural coords
+            lazy (bool, optional): Only process pages when they are first accessed. Default: False
         Raises:
             ValueError: If the page range is invalid.
             FileNotFoundError: If the file is not found.
             PermissionError: If the file is encrypted or the password is wrong.
             RuntimeError: If an unknown error is generated by transfotmer.
         """
-        self.pages: list[MemoryMap] = []
+        self.pages: Sequence[MemoryMap] = []
         self.extraction_tolerance: int = extraction_tolerance
         if pdf_file:
             self.load(
@@ -53,6 +56,7 @@ class HotPdf:
                 laparams=laparams,
                 include_annotation_spaces=include_annotation_spaces,
                 preserve_pdfminer_coordinates=preserve_pdfminer_coordinates,
+                lazy=lazy,
             )
 
     def __check_file_exists(self, pdf_file: str) -> None:
@@ -68,8 +72,8 @@ class HotPdf:
             raise ValueError("Invalid page number")
 
     def __check_page_numbers(self, pages: list[int]) -> None:
-        for page in pages:
-            self.__check_page_number(page)
+        if pages and (min(pages) < 0 or max(pages) >= len(self.pages)):
+            raise ValueError("Invalid page number")
 
     def __check_page_range(self, page_numbers: list[int]) -> None:
         if any(_page_num < 0 for _page_num in page_numbers):
@@ -98,8 +102,7 @@ class HotPdf:
         if any(_hotpdf is None for _hotpdf in hotpdfs):
             raise HotPdfIsNoneError("HotPdf object cannot be None")
         merged_hotpdf = HotPdf()
-        for _hotpdf in hotpdfs:
-            merged_hotpdf.pages.extend(_hotpdf.pages)
+        merged_hotpdf.pages = [page for _hotpdf in hotpdfs for page in _hotpdf.pages]
         return merged_hotpdf
 
     def load(
@@ -110,6 +113,7 @@ class HotPdf:
         laparams: Optional[dict[str, Union[float, bool]]] = None,
         include_annotation_spaces: bool = False,
         preserve_pdfminer_coordinates: bool = False,
+        lazy: bool = False,
     ) -> None:
         """Load a PDF file into memory.
 
@@ -122,13 +126,17 @@ class HotPdf:
             include_annotation_spaces (bool, optional): Add annotation spaces to the memory map.
             preserve_pdfminer_coordinates (bool, Optional): Preserve pdfminer y-coordinate values.
                 Default: False - use natural coords
+            lazy (bool, optional): Only process pages when they are first accessed.
+                The pdf_file must stay available (streams open) for as long as pages are accessed.
+                Default: False - process all pages while loading
         Raises:
             Exception: If an unknown error is generated by pdfminer.
         """
         page_numbers = page_numbers or []
         self.__prechecks(pdf_file, page_numbers)
+        process = processor.process_lazy if lazy else processor.process
         try:
-            self.pages = processor.process(
+            self.pages = process(
                 source=pdf_file,
                 password=password,
                 page_numbers=page_numbers,
@@ -139,6 +147,27 @@ class HotPdf:
         except Exception as e:
             raise e
 
+    def build_indexes(self, pages: Optional[list[int]] = None) -> None:
+        """Build the search and extraction indexes of the pages up front.
+
+        Indexes are built lazily on first use by default. Building them ahead of time, e.g. when
+        a service starts, avoids the slower first call to find_text and the extraction functions.
+        Lazily loaded pages are processed as well.
+
+        Args:
+            pages (list[int], optional): List of page numbers to build the indexes for.
+                If not provided, will build the indexes of all pages (default).
+
+        Raises:
+            ValueError: If the page number is invalid.
+        """
+        pages = pages or list(range(len(self.pages)))
+
+        self.__check_page_numbers(pages)
+
+        for page_num in pages:
+            self.pages[page_num].build_indexes()
+
     def __extract_full_text_span(
         self,
         hot_characters: list[HotCharacter],
@@ -158,6 +187,54 @@ class HotPdf:
             _span = self.pages[page_num].span_map[hot_characters[0].span_id]
         return _span.characters if _span else None
 
+    def __find_on_page(
+        self,
+        query: str,
+        page_num: int,
+        take_span: bool,
+        sort: bool,
+    ) -> PageResult:
+        """Find text within a single loaded page.
+
+        Args:
+            query (str): The text to search for.
+            page_num (int): The page number to search.
+            take_span (bool): Take the full span of the text that it is a part of.
+            sort (bool): Return elements sorted by their positions.
+
+        Returns:
+            PageResult: All occurences of the query on the page.
+        """
+        hot_character_page_occurences: PageResult = self.pages[page_num].find_adjacent_text(query)
+        page_result: PageResult = []
+        seen_span_ids: set[UUID] = set()
+        for hot_characters in hot_character_page_occurences:
+            full_span_dimension_hot_characters: Union[list[HotCharacter], None] = (
+                self.__extract_full_text_span(
+                    hot_characters=hot_characters,
+                    page_num=page_num,
+                )
+                if take_span
+                else None
+            )
+            if full_span_dimension_hot_characters:
+                # Several occurences can lie in the same span, only take it once
+                span_id = full_span_dimension_hot_characters[0].span_id
+                if span_id in seen_span_ids:
+                    continue
+                seen_span_ids.add(span_id)
+            chars_to_append = (
+                full_span_dimension_hot_characters
+                if (take_span and full_span_dimension_hot_characters)
+                else hot_characters
+            )
+            if chars_to_append and sort:
+                chars_to_append = sorted(chars_to_append, key=attrgetter("y", "x"))
+            page_result.append(chars_to_append)
+        if sort:
+            page_result = sorted(page_result, key=lambda element: (element[0].y, element[0].x))
+        return page_result
+
     def find_text(
         self,
         query: str,
@@ -182,46 +259,42 @@ class HotPdf:
 
         self.__check_page_numbers(pages)
 
-        query_pages = (
-            {i: self.pages[i] for i in range(len(self.pages))} if len(pages) == 0 else {i: self.pages[i] for i in pages}
-        )
+        # Duplicate page numbers are only searched once
+        query_pages: Iterable[int] = dict.fromkeys(pages) if pages else range(len(self.pages))
 
-        found_page_map = {}
+        final_found_page_map: SearchResult = {
+            page_num: self.__find_on_page(query, page_num, take_span, sort) for page_num in query_pages
+        }
+        return final_found_page_map
 
-        for page_num in query_pages:
-            found_page_map[page_num] = filter_adjacent_coords(*query_pages[page_num].find_text(query))
+    def find_texts(
+        self,
+        queries: list[str],
+        pages: Optional[list[int]] = None,
+        take_span: bool = False,
+        sort: bool = True,
+    ) -> dict[str, SearchResult]:
+        """Find multiple texts within the loaded PDF pages.
 
-        final_found_page_map: SearchResult = defaultdict(PageResult)
+        Convenience wrapper calling find_text once per unique query, no work is shared between the queries.
 
-        for page_num in found_page_map:
-            hot_character_page_occurences: PageResult = found_page_map[page_num]
-            final_found_page_map[page_num] = []
-            for hot_characters in hot_character_page_occurences:
-                text = "".join(hc.value for hc in hot_characters)
-                if query not in text:
-                    continue
-                full_span_dimension_hot_characters: Union[list[HotCharacter], None] = (
-                    self.__extract_full_text_span(
-                        hot_characters=hot_characters,
-                        page_num=page_num,
-                    )
-                    if take_span
-                    else None
-                )
-                chars_to_append = (
-                    full_span_dimension_hot_characters
-                    if (take_span and full_span_dimension_hot_characters)
-                    else hot_characters
-                )
-                if chars_to_append and sort:
-                    chars_to_append = sorted(chars_to_append, key=lambda ch: (ch.y, ch.x))
-                final_found_page_map[page_num].append(chars_to_append)
-        if sort:
-            for _page in final_found_page_map:
-                final_found_page_map[_page] = sorted(
-                    final_found_page_map[_page], key=lambda element: (element[0].y, element[0].x)
-                )
-        return final_found_page_map
+        Args:
+            queries (list[str]): The texts to search for.
+            pages (list[int], optional): List of page numbers to search.
+            take_span (bool, optional): Take the full span of the text that it is a part of.
+            sort (bool, Optional): Return elements sorted by their positions.
+        Raises:
+            ValueError: If the page number is invalid.
+
+        Returns:
+            dict[str, SearchResult]: A dictionary mapping each query to its SearchResult.
+        """
+        self.__check_page_numbers(pages or [])
+
+        return {
+            query: self.find_text(query, pages=pages, take_span=take_span, sort=sort)
+            for query in dict.fromkeys(queries)
+        }
 
     def extract_spans(self, x0: int, y0: int, x1: int, y1: int, page: int = 0, sort: bool = True) -> list[Span]:
         """Extract spans that intersect with the given bounding box.
@@ -241,20 +314,10 @@ class HotPdf:
         Returns:
             list[Span]: List of spans of hotcharacters that intersect with the given bounding box
         """
-        spans: list[Span] = []
-
         self.__check_coordinates(x0, y0, x1, y1)
         self.__check_page_number(page)
 
-        for _, span in self.pages[page].span_map.items():
-            if intersect(ElementDimension(x0, y0, x1, y1, None), span.get_element_dimension()):
-                span.characters = sorted(span.characters, key=lambda ch: (ch.y, ch.x))
-                spans.append(span)
-                if sort:
-                    spans = sorted(
-                        spans, key=lambda span: (span.get_element_dimension().y0, span.get_element_dimension().x0)
-                    )
-
+        spans: list[Span] = self.pages[page].get_span_index().query(x0, y0, x1, y1, sort=sort)
         return spans
 
     def extract_text(
@@ -285,9 +348,11 @@ class HotPdf:
         self.__check_page_number(page)
 
         page_to_search: MemoryMap = self.pages[page]
+        x1 += self.extraction_tolerance
+        # Coordinates are usually ints already, only round when floats are passed
         extracted_text = page_to_search.extract_text_from_bbox(
-            x0=math.floor(x0),
-            x1=math.ceil(x1 + self.extraction_tolerance),
+            x0=x0 if isinstance(x0, int) else math.floor(x0),
+            x1=x1 if isinstance(x1, int) else math.ceil(x1),
             y0=y0,
             y1=y1,
         )
@@ -310,14 +375,7 @@ class HotPdf:
         """
         self.__check_page_number(page)
 
-        page_to_search: MemoryMap = self.pages[page]
-        extracted_text = page_to_search.extract_text_from_bbox(
-            x0=0,
-            x1=page_to_search.width,
-            y0=0,
-            y1=page_to_search.height,
-        )
-        return extracted_text
+        return self.pages[page].extract_full_text()
 
     def extract_spans_text(
         self,
@@ -343,12 +401,27 @@ class HotPdf:
         Returns:
             str: Extracted text that intersects with the bounding box.
         """
-        self.__check_coordinates(x0, y0, x1, y1)
-        self.__check_page_number(page)
+        # Coordinates and page number are checked by extract_spans
+        return "".join(span.to_text() for span in self.extract_spans(x0, y0, x1, y1, page))
 
-        spans: list[Span] = self.extract_spans(x0, y0, x1, y1, page)
-        extracted_text: list[str] = []
+    def extract_pages_text(
+        self,
+        pages: Optional[list[int]] = None,
+    ) -> list[str]:
+        """Extract text from multiple pages.
+
+        Args:
+            pages (list[int], optional): List of page numbers to extract.
+                If not provided, will extract all pages (default).
+
+        Raises:
+            ValueError: If the page number is invalid.
+
+        Returns:
+            list[str]: Extracted text of each page, in the order of the requested pages.
+        """
+        pages = pages or list(range(len(self.pages)))
+
+        self.__check_page_numbers(pages)
 
-        for span in spans:
-            extracted_text.append(span.to_text())
-        return "".join(extracted_text)
+        return [self.extract_page_text(page) for page in pages]
@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+from threading import Lock
+from typing import Callable, Optional, Union, overload
+
+from .memory_map import MemoryMap
+
+
+class LazyPages(Sequence[MemoryMap]):
+    """Sequence of pages that are only processed when they are accessed.
+
+    Each page is loaded into a MemoryMap on first access and kept for subsequent accesses.
+    """
+
+    def __init__(self, page_numbers: list[int], load_page: Callable[[int], MemoryMap]) -> None:
+        """Initialize the LazyPages.
+
+        Args:
+            page_numbers (list[int]): Page numbers of the PDF (0-indexed) backing each index of the sequence.
+            load_page (Callable[[int], MemoryMap]): Function processing a page number into a MemoryMap.
+        """
+        self.page_numbers: list[int] = page_numbers
+        self.__load_page = load_page
+        self.__pages: list[Optional[MemoryMap]] = [None] * len(page_numbers)
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__pages)
+
+    @overload
+    def __getitem__(self, index: int) -> MemoryMap: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[MemoryMap]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[MemoryMap, list[MemoryMap]]:
+        if isinstance(index, slice):
+            return [self.__get_page(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Page index out of range")
+        return self.__get_page(index)
+
+    def __get_page(self, index: int) -> MemoryMap:
+        page = self.__pages[index]
+        if page is None:
+            # The PDF source is shared between pages, only process one page at a time
+            with self.__lock:
+                page = self.__pages[index]
+                if page is None:
+                    page = self.__pages[index] = self.__load_page(self.page_numbers[index])
+        return page
+
+    def is_loaded(self, index: int) -> bool:
+        """Check if the page at the given index has already been processed.
+
+        Args:
+            index (int): Index of the page.
+
+        Returns:
+            bool: True if the page has been processed, else False.
+        """
+        return self.__pages[index] is not None
@@ -1,15 +1,17 @@
 import math
 from collections import defaultdict
 from collections.abc import Generator
-from typing import Union
+from typing import Optional, Union
 from uuid import UUID, uuid4
 
 from pdfminer.layout import LTAnno, LTChar, LTComponent, LTFigure, LTPage, LTText, LTTextContainer, LTTextLine
 
 from .data.classes import HotCharacter, PageResult
+from .span_index import SpanIndex
 from .span_map import SpanMap
 from .sparse_matrix import SparseMatrix
 from .trie import Trie
+from .utils import filter_adjacent_coords, group_by_row
 
 
 class MemoryMap:
@@ -22,6 +24,9 @@ class MemoryMap:
         """
         self.text_trie = Trie()
         self.span_map = SpanMap()
+        self._span_index: Optional[SpanIndex] = None
+        self._row_index: dict[str, dict[int, list[HotCharacter]]] = {}
+        self._full_text: Optional[str] = None
         self.width: int = 0
         self.height: int = 0
 
@@ -225,17 +230,52 @@ class MemoryMap:
             str: Extracted text within the bounding box.
         """
         extracted_text: str = ""
-        for row in range(max(y0, 0), min(y1, self.memory_map.rows - 1) + 1):
-            row_text: str = ""
-            row_text = "".join(
-                self.memory_map.get(row_idx=row, column_idx=col)
-                for col in range(max(x0, 0), min(x1, self.memory_map.columns - 1) + 1)
-            )
+        start_column, end_column = max(x0, 0), min(x1, self.memory_map.columns - 1)
+        for row in self.memory_map.get_filled_rows(max(y0, 0), min(y1, self.memory_map.rows - 1)):
+            row_text: str = self.memory_map.get_row_text(row, start_column, end_column)
             if row_text:
                 extracted_text += row_text + "\n"
 
         return extracted_text
 
+    def extract_full_text(self) -> str:
+        """Extract the text of the whole page.
+
+        Text of the bounding box covering the page. Pages do not change after being loaded,
+        so the text is computed once and cached.
+
+        Returns:
+            str: Extracted text of the page.
+        """
+        if self._full_text is None:
+            self._full_text = self.extract_text_from_bbox(x0=0, x1=self.width, y0=0, y1=self.height)
+        return self._full_text
+
+    def build_indexes(self) -> None:
+        """Build all the indexes of the page up front.
+
+        Indexes are otherwise built on the first search or extraction that needs them,
+        which makes that first call slower than the following ones.
+        """
+        self.get_span_index()
+        # The full text is extracted through the row index of the memory map, building it as well
+        self.extract_full_text()
+        for character, node in self.text_trie.root.children.items():
+            if node.is_end_of_word:
+                self.__get_row_index(character, node.hot_characters)
+
+    def get_span_index(self) -> SpanIndex:
+        """Get the spatial index of the spans on the page.
+
+        The index is built on first use, so pages that are never queried for spans do not pay for it.
+
+        Returns:
+            SpanIndex: Spatial index over the spans of the page.
+        """
+        if self._span_index is None:
+            self._span_index = SpanIndex(self.span_map)
+        return self._span_index
+
     def find_text(self, query: str) -> tuple[list[str], PageResult]:
         """Find text within the memory map.
 
@@ -247,3 +287,32 @@ class MemoryMap:
         """
         found_text = self.text_trie.search_all(query)
         return found_text
+
+    def __get_row_index(self, character: str, hot_characters: list[HotCharacter]) -> dict[int, list[HotCharacter]]:
+        """Get the occurences of a character grouped by row, building them on first use."""
+        row_index = self._row_index.get(character)
+        if row_index is None:
+            row_index = self._row_index[character] = group_by_row(hot_characters)
+        return row_index
+
+    def find_adjacent_text(self, query: str) -> PageResult:
+        """Find groups of adjacent characters matching the query within the memory map.
+
+        The occurences of each character are indexed by row once per page and reused by
+        every subsequent query. Only groups whose text contains the query are returned.
+
+        Args:
+            query (str): The text to search for.
+
+        Returns:
+            PageResult: List of adjacent groups of HotCharacters on the page.
+        """
+        found, hot_characters = self.find_text(query)
+        # Every group holds one occurence of each found character, in order,
+        # so all groups spell the same text and can be validated at once.
+        if query not in "".join(found):
+            return []
+        row_index = [
+            self.__get_row_index(character, occurences) for character, occurences in zip(found, hot_characters)
+        ]
+        return filter_adjacent_coords(found, hot_characters, row_index)
@@ -1,11 +1,20 @@
 import logging
+import weakref
+from contextlib import ExitStack
 from io import IOBase
 from pathlib import PurePath
-from typing import Optional, Union
+from typing import BinaryIO, Optional, Union, cast
 
+from pdfminer.converter import PDFPageAggregator
 from pdfminer.high_level import extract_pages
-from pdfminer.layout import LAParams
+from pdfminer.layout import LAParams, LTPage
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.utils import open_filename
 
+from hotpdf.lazy_pages import LazyPages
 from hotpdf.memory_map import MemoryMap
 
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -44,15 +53,79 @@ def __process(
         source, password=password, page_numbers=page_numbers, caching=True, laparams=laparams_obj
     )
     for page_layout in hl_page_layouts:
-        parsed_page: MemoryMap = MemoryMap()
-        parsed_page.build_memory_map()
-        parsed_page.load_memory_map(
-            page=page_layout,
+        pages.append(
+            __load_page_layout(
+                page_layout,
+                include_annotation_spaces=include_annotation_spaces,
+                preserve_pdfminer_coordinates=preserve_pdfminer_coordinates,
+            )
+        )
+    return pages
+
+
+def __load_page_layout(
+    page_layout: LTPage,
+    include_annotation_spaces: bool = False,
+    preserve_pdfminer_coordinates: bool = False,
+) -> MemoryMap:
+    parsed_page: MemoryMap = MemoryMap()
+    parsed_page.build_memory_map()
+    parsed_page.load_memory_map(
+        page=page_layout,
+        include_annotation_spaces=include_annotation_spaces,
+        preserve_pdfminer_coordinates=preserve_pdfminer_coordinates,
+    )
+    return parsed_page
+
+
+def __open_pages(fp: BinaryIO, password: str = "") -> list[PDFPage]:
+    parser = PDFParser(fp)
+    document = PDFDocument(parser, password=password, caching=True)
+    return list(PDFPage.create_pages(document))
+
+
+def __process_lazy(
+    source: Union[PurePath, str, IOBase],
+    password: str = "",
+    page_numbers: Optional[list[int]] = None,
+    laparams: Optional[dict[str, Union[float, bool]]] = None,
+    include_annotation_spaces: bool = False,
+    preserve_pdfminer_coordinates: bool = False,
+) -> LazyPages:
+    __supress_pdfminer_logs()
+    laparams_obj = __make_custom_laparams_object(laparams) or LAParams()
+    # The document is only parsed once, and kept open to process its pages on access
+    file_stack = ExitStack()
+    fp = cast(BinaryIO, file_stack.enter_context(open_filename(source, "rb")))
+    try:
+        # Opening the document surfaces invalid files and passwords right away
+        pdf_pages = __open_pages(fp, password=password)
+    except Exception:
+        file_stack.close()
+        raise
+    # Same pages as pdfminer loads: sorted, unique and within the document
+    page_numbers = (
+        sorted({page_num for page_num in page_numbers if page_num < len(pdf_pages)})
+        if page_numbers
+        else list(range(len(pdf_pages)))
+    )
+
+    resource_manager = PDFResourceManager(caching=True)
+    device = PDFPageAggregator(resource_manager, laparams=laparams_obj)
+    interpreter = PDFPageInterpreter(resource_manager, device)
+
+    def load_page(page_number: int) -> MemoryMap:
+        interpreter.process_page(pdf_pages[page_number])
+        return __load_page_layout(
+            device.get_result(),
             include_annotation_spaces=include_annotation_spaces,
             preserve_pdfminer_coordinates=preserve_pdfminer_coordinates,
         )
-        pages.append(parsed_page)
-    return pages
+
+    lazy_pages = LazyPages(page_numbers, load_page)
+    # Close the file opened from a path once the pages are no longer referenced
+    weakref.finalize(lazy_pages, file_stack.close)
+    return lazy_pages
 
 
 def process(
@@ -71,3 +144,21 @@ def process(
         include_annotation_spaces=include_annotation_spaces,
         preserve_pdfminer_coordinates=preserve_pdfminer_coordinates,
     )
+
+
+def process_lazy(
+    source: Union[PurePath, str, IOBase],
+    password: str = "",
+    page_numbers: Optional[list[int]] = None,
+    laparams: Optional[dict[str, Union[float, bool]]] = None,
+    include_annotation_spaces: bool = False,
+    preserve_pdfminer_coordinates: bool = False,
+) -> LazyPages:
+    return __process_lazy(
+        source=source,
+        password=password,
+        page_numbers=page_numbers,
+        laparams=laparams,
+        include_annotation_spaces=include_annotation_spaces,
+        preserve_pdfminer_coordinates=preserve_pdfminer_coordinates,
+    )
@@ -0,0 +1,83 @@
+from bisect import bisect_left, bisect_right
+
+from .data.classes import ElementDimension, Span
+from .span_map import SpanMap
+
+
+def _aabb_hits(
+    x0s: list[int],
+    y0s: list[int],
+    x1s: list[int],
+    y1s: list[int],
+    lo: int,
+    hi: int,
+    x0: int,
+    y0: int,
+    x1: int,
+    y1: int,
+) -> list[int]:
+    """Find the indices in [lo, hi) whose bounding box overlaps with (x0, y0, x1, y1).
+
+    The coordinate columns are compared in a single pass over their slices, without indexing per element.
+    """
+    return [
+        i
+        for i, span_x0, span_y0, span_x1, span_y1 in zip(range(lo, hi), x0s[lo:hi], y0s[lo:hi], x1s[lo:hi], y1s[lo:hi])
+        if span_x0 <= x1 and span_x1 >= x0 and span_y0 <= y1 and span_y1 >= y0
+    ]
+
+
+class SpanIndex:
+    """Spatial index over the spans of a page for fast bounding box queries.
+
+    Spans are kept sorted by their starting row, so a query only has to look at
+    the spans whose rows can overlap the bounding box instead of every span on the page.
+    """
+
+    def __init__(self, span_map: SpanMap) -> None:
+        """Build the index from the spans of a page.
+
+        Args:
+            span_map (SpanMap): Spans of the page to be indexed.
+        """
+        entries: list[tuple[int, Span, ElementDimension]] = []
+        for rank, (span_id, _) in enumerate(span_map.items()):
+            span = span_map[span_id]
+            if not span or not span.characters:
+                continue
+            entries.append((rank, span, span.get_element_dimension()))
+        entries.sort(key=lambda entry: entry[2].y0)
+
+        self.ranks: list[int] = [rank for rank, _, _ in entries]
+        self.spans: list[Span] = [span for _, span, _ in entries]
+        # Bounding boxes are stored as parallel coordinate columns
+        self.x0s: list[int] = [dimension.x0 for _, _, dimension in entries]
+        self.y0s: list[int] = [dimension.y0 for _, _, dimension in entries]
+        self.x1s: list[int] = [dimension.x1 for _, _, dimension in entries]
+        self.y1s: list[int] = [dimension.y1 for _, _, dimension in entries]
+        self.__max_height: int = max((y1 - y0 for y0, y1 in zip(self.y0s, self.y1s)), default=0)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def query(self, x0: int, y0: int, x1: int, y1: int, sort: bool = False) -> list[Span]:
+        """Find the spans that intersect with a bounding box.
+
+        Args:
+            x0 (int): The left x-coordinate of the bounding box.
+            y0 (int): The bottom y-coordinate of the bounding box.
+            x1 (int): The right x-coordinate of the bounding box.
+            y1 (int): The top y-coordinate of the bounding box.
+            sort (bool, optional): Sort the spans by their coordinates (y0, x0). Defaults to False.
+
+        Returns:
+            list[Span]: Intersecting spans, in the order they were inserted into the page unless sorted.
+        """
+        lo = bisect_left(self.y0s, y0 - self.__max_height)
+        hi = bisect_right(self.y0s, y1)
+        hits = _aabb_hits(self.x0s, self.y0s, self.x1s, self.y1s, lo, hi, x0, y0, x1, y1)
+        hits.sort(key=self.ranks.__getitem__)
+        if sort:
+            y0s, x0s = self.y0s, self.x0s
+            hits.sort(key=lambda i: (y0s[i], x0s[i]))
+        return [self.spans[i] for i in hits]
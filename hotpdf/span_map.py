@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from operator import attrgetter
 from typing import Union
 from uuid import UUID
 
@@ -41,5 +42,5 @@ class SpanMap:
         span = self.span_map.get(span_id)
         if not span:
             return None
-        span.characters = sorted(span.characters, key=lambda ch: (ch.y, ch.x))
+        span.characters = sorted(span.characters, key=attrgetter("y", "x"))
         return span
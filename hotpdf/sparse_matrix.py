@@ -1,5 +1,7 @@
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from collections.abc import Iterator
+from typing import Optional
 from warnings import warn
 
 
@@ -14,6 +16,9 @@ class SparseMatrix:
         self.values: defaultdict[tuple[int, int], str] = defaultdict(str)
         self.rows = rows
         self.columns = columns
+        # Filled cells grouped by row: row index -> (sorted column indices, values), and the sorted filled rows.
+        # Both are kept in a single tuple so that readers in other threads never see a half built index.
+        self.__row_index: Optional[tuple[dict[int, tuple[list[int], list[str]]], list[int]]] = None
 
     def __getitem__(self, key: tuple[int, int]) -> str:
         row_idx, column_idx = key
@@ -41,6 +46,7 @@ class SparseMatrix:
         self.__update_indices(row_idx, column_idx)
         if value:
             self.values[(row_idx, column_idx)] = value
+            self.__row_index = None
 
     def __iter__(self) -> Iterator[tuple[tuple[int, int], str]]:
         yield from self.values.items()
@@ -54,7 +60,48 @@ class SparseMatrix:
             return
         if value:
             self.values[(row_idx, column_idx)] = value
+            self.__row_index = None
 
     def get(self, row_idx: int, column_idx: int) -> str:
         self.__check_indices(row_idx, column_idx)
         return self.values[(row_idx, column_idx)]
+
+    def build_row_index(self) -> dict[int, tuple[list[int], list[str]]]:
+        """Build the index of filled cells per row, if not built since the last insertion.
+
+        The index is built on first use by get_filled_rows and get_row_text.
+
+        Returns:
+            dict[int, tuple[list[int], list[str]]]: Sorted column indices and values of each filled row.
+        """
+        return self.__get_row_index()[0]
+
+    def __get_row_index(self) -> tuple[dict[int, tuple[list[int], list[str]]], list[int]]:
+        row_index = self.__row_index
+        if row_index is None:
+            rows: defaultdict[int, list[tuple[int, str]]] = defaultdict(list)
+            for (row_idx, column_idx), value in self.values.items():
+                if value:
+                    rows[row_idx].append((column_idx, value))
+            row_cells: dict[int, tuple[list[int], list[str]]] = {}
+            for row_idx, cells in rows.items():
+                cells.sort()
+                row_cells[row_idx] = ([column_idx for column_idx, _ in cells], [value for _, value in cells])
+            row_index = self.__row_index = (row_cells, sorted(row_cells))
+        return row_index
+
+    def get_filled_rows(self, start_row: int, end_row: int) -> list[int]:
+        """Get the indices of the rows that have at least one value, between start_row and end_row (inclusive)."""
+        row_numbers = self.__get_row_index()[1]
+        return row_numbers[bisect_left(row_numbers, start_row) : bisect_right(row_numbers, end_row)]
+
+    def get_row_text(self, row_idx: int, start_column: int, end_column: int) -> str:
+        """Get the text of a row between start_column and end_column (inclusive).
+
+        Only the filled cells of the row are visited.
+        """
+        row = self.build_row_index().get(row_idx)
+        if not row:
+            return ""
+        column_indices, values = row
+        return "".join(values[bisect_left(column_indices, start_column) : bisect_right(column_indices, end_column)])
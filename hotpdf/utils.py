@@ -1,4 +1,5 @@
-from typing import Union
+from collections import defaultdict
+from typing import Optional, Union
 
 from .data.classes import ElementDimension, HotCharacter, PageResult
 
@@ -41,12 +42,33 @@ def find_neighbour_coord(
     return None
 
 
-def filter_adjacent_coords(text: list[str], page_hot_character_occurences: PageResult) -> PageResult:
+def group_by_row(hot_characters: list[HotCharacter]) -> dict[int, list[HotCharacter]]:
+    """Group HotCharacters by the row (y-coordinate) they lie on.
+
+    Args:
+        hot_characters (list[HotCharacter]): List of character instances to group.
+
+    Returns:
+        dict[int, list[HotCharacter]]: Characters of each row, in their original order.
+    """
+    rows: defaultdict[int, list[HotCharacter]] = defaultdict(list)
+    for hot_character in hot_characters:
+        rows[hot_character.y].append(hot_character)
+    return dict(rows)
+
+
+def filter_adjacent_coords(
+    text: list[str],
+    page_hot_character_occurences: PageResult,
+    row_index: Optional[list[dict[int, list[HotCharacter]]]] = None,
+) -> PageResult:
     """Filter adjacent coordinates based on the given text.
 
     Args:
         text (str): The text to filter by.
         page_hot_character_occurences (list): List of coordinates to filter by page
+        row_index (list, optional): Occurences of each character grouped by row, see `group_by_row`.
+            Built from page_hot_character_occurences if not provided.
 
     Returns:
         PageResult: List of adjacent groups of HotCharacters on a page.
@@ -58,18 +80,23 @@ def filter_adjacent_coords(text: list[str], page_hot_character_occurences: PageR
     adjacent_groups = []
 
     anchor_hot_character_instances = page_hot_character_occurences[0]
+    # Neighbours always lie on the same row, so only that row has to be searched
+    if row_index is None:
+        row_index = [group_by_row(coords_j) for coords_j in page_hot_character_occurences]
 
     for anchor_hot_character in anchor_hot_character_instances:
         neighbours = [anchor_hot_character]
         reference_hot_character = anchor_hot_character
-        for coords_j in page_hot_character_occurences[1:]:
+        for rows_j in row_index[1:]:
             neighbour_hot_character = find_neighbour_coord(
                 reference_character=reference_hot_character,
-                hot_characters=coords_j,
+                hot_characters=rows_j.get(reference_hot_character.y, []),
             )
-            if neighbour_hot_character:
-                neighbours.append(neighbour_hot_character)
-                reference_hot_character = neighbour_hot_character
+            if not neighbour_hot_character:
+                # The group can no longer hold every character of the text
+                break
+            neighbours.append(neighbour_hot_character)
+            reference_hot_character = neighbour_hot_character
         if len(neighbours) == max_len:
             adjacent_groups.append(neighbours[:])
             neighbours.clear()
@@ -1,13 +1,16 @@
 import shutil
+import sys
 from uuid import uuid4
 
 import pytest
 
 from hotpdf import HotPdf
 from hotpdf.data.classes import ElementDimension as El
-from hotpdf.data.classes import HotCharacter
+from hotpdf.data.classes import HotCharacter, Span
+from hotpdf.span_index import SpanIndex
+from hotpdf.span_map import SpanMap
 from hotpdf.sparse_matrix import SparseMatrix
-from hotpdf.utils import filter_adjacent_coords, intersect, to_text
+from hotpdf.utils import filter_adjacent_coords, group_by_row, intersect, to_text
 
 
 @pytest.fixture()
@@ -76,6 +79,24 @@ def test_sparse_matrix_iterator():
     assert non_empty_values == expected_result
 
 
+def test_sparse_matrix_row_text():
+    matrix = SparseMatrix()
+    matrix.insert("A", 0, 0)
+    matrix.insert("B", 0, 5)
+    matrix.insert("C", 0, 2)
+    matrix.insert("D", 3, 1)
+    assert matrix.get_filled_rows(0, 10) == [0, 3]
+    assert matrix.get_filled_rows(1, 3) == [3]
+    assert matrix.get_row_text(0, 0, 10) == "ACB"
+    assert matrix.get_row_text(0, 1, 4) == "C"
+    assert matrix.get_row_text(1, 0, 10) == ""
+
+    # Index is rebuilt after an insertion
+    matrix[1, 4] = "E"
+    assert matrix.get_filled_rows(0, 10) == [0, 1, 3]
+    assert matrix.get_row_text(1, 0, 10) == "E"
+
+
 @pytest.mark.parametrize(
     "bbox1, bbox2, expected",
     [
@@ -155,3 +176,75 @@ def test_span_map_get_span_none(valid_file_name):
 def test_span_map_set_none_error(valid_file_name):
     # Setting non span object in spanmap should throw error
     pass
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        El(0, 0, 1000, 1000),
+        El(0, 0, 300, 200),
+        El(100, 150, 400, 160),
+        El(50, 400, 51, 401),
+        El(2000, 2000, 3000, 3000),
+    ],
+)
+def test_span_index_query(valid_file_name, bbox):
+    hotpdf_object = HotPdf(valid_file_name)
+    span_map = hotpdf_object.pages[0].span_map
+    expected = [span for _, span in span_map.items() if intersect(bbox, span.get_element_dimension())]
+    span_index = SpanIndex(span_map)
+    assert len(span_index) == len(span_map)
+    assert span_index.query(bbox.x0, bbox.y0, bbox.x1, bbox.y1) == expected
+    assert span_index.query(bbox.x0, bbox.y0, bbox.x1, bbox.y1, sort=True) == sorted(
+        expected, key=lambda span: (span.get_element_dimension().y0, span.get_element_dimension().x0)
+    )
+
+
+def test_span_index_cached(valid_file_name):
+    hotpdf_object = HotPdf(valid_file_name)
+    page = hotpdf_object.pages[0]
+    assert page.get_span_index() is page.get_span_index()
+
+
+def test_group_by_row(test_uuid):
+    first = HotCharacter(value="a", x=0, y=0, x_end=1, span_id=test_uuid)
+    second = HotCharacter(value="a", x=5, y=2, x_end=6, span_id=test_uuid)
+    third = HotCharacter(value="a", x=3, y=0, x_end=4, span_id=test_uuid)
+    assert group_by_row([first, second, third]) == {0: [first, third], 2: [second]}
+    assert group_by_row([]) == {}
+
+
+@pytest.mark.parametrize("query", ["EXPERIENCE", "PDF", "E", "HOTPDF"])
+def test_find_adjacent_text(valid_file_name, query):
+    hotpdf_object = HotPdf(valid_file_name)
+    page = hotpdf_object.pages[0]
+    expected = filter_adjacent_coords(*page.find_text(query))
+    assert expected
+    assert page.find_adjacent_text(query) == expected
+    # Served from the cached row index
+    assert page.find_adjacent_text(query) == expected
+
+
+def test_find_adjacent_text_missing_character(valid_file_name):
+    hotpdf_object = HotPdf(valid_file_name)
+    page = hotpdf_object.pages[0]
+    query = "EXPERIENCE\u2603"
+    # The trie skips characters that are not on the page
+    assert filter_adjacent_coords(*page.find_text(query))
+    assert page.find_adjacent_text(query) == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10")
+def test_data_classes_slots(test_uuid):
+    hot_character = HotCharacter(value="H", x=0, y=0, x_end=10, span_id=test_uuid)
+    span = Span(characters=[hot_character], span_id=test_uuid)
+    for instance in (hot_character, span, span.get_element_dimension()):
+        assert not hasattr(instance, "__dict__")
+
+
+@pytest.mark.parametrize("x", [100, 100_000])
+def test_span_index_coordinates(test_uuid, x):
+    span_map = SpanMap()
+    span_map[test_uuid] = HotCharacter(value="H", x=x, y=5, x_end=x + 10, span_id=test_uuid)
+    span_index = SpanIndex(span_map)
+    assert span_index.query(x, 0, x + 1, 10) == [span_map[test_uuid]]
@@ -1,9 +1,12 @@
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 from unittest.mock import patch
 
 import pytest
 from pdfminer.pdfdocument import PDFPasswordIncorrect
-from pdfminer.pdfparser import PDFSyntaxError
+from pdfminer.pdfparser import PDFParser, PDFSyntaxError
 
 from hotpdf import HotPdf
 from hotpdf.data.classes import ElementDimension
@@ -464,3 +467,160 @@ def test_extract_spans_pdfminer_y_preserved(valid_file_name):
     # extract from the bottom left of file
     spans = hot_pdf_object.extract_spans(x0=0, y0=0, x1=300, y1=200)
     assert "EMAIL" in spans[0].to_text()
+
+
+def test_extract_pages_text(multiple_pages_file_name):
+    hot_pdf_object = HotPdf(multiple_pages_file_name)
+    pages_text = hot_pdf_object.extract_pages_text()
+    assert len(pages_text) == 20
+    assert pages_text == [hot_pdf_object.extract_page_text(page=i) for i in range(20)]
+    assert hot_pdf_object.extract_pages_text(pages=[3, 1]) == [pages_text[3], pages_text[1]]
+
+
+def test_extract_text_concurrent_first_use(valid_file_name):
+    def extract_text(hot_pdf_object, barrier):
+        barrier.wait()
+        return hot_pdf_object.extract_text(0, 0, 1000, 1000)
+
+    expected_text = HotPdf(valid_file_name).extract_text(0, 0, 1000, 1000)
+    switch_interval = sys.getswitchinterval()
+    # Switch threads often, so they read the indexes of a fresh load while another thread builds them
+    sys.setswitchinterval(1e-4)
+    try:
+        for _ in range(20):
+            hot_pdf_object, barrier = HotPdf(valid_file_name), Barrier(4)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(extract_text, hot_pdf_object, barrier) for _ in range(4)]
+                assert [future.result() for future in futures] == [expected_text] * 4
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_find_text_take_span_unique(multiple_pages_file_name):
+    hot_pdf_object = HotPdf(multiple_pages_file_name)
+    occurences = hot_pdf_object.find_text("the", take_span=True)
+    occurences_without_span = hot_pdf_object.find_text("the")
+    for page_num, page_occurences in occurences.items():
+        span_ids = [occurence[0].span_id for occurence in page_occurences]
+        assert len(span_ids) == len(set(span_ids))
+        assert set(span_ids) == {occurence[0].span_id for occurence in occurences_without_span[page_num]}
+
+
+@pytest.mark.parametrize("include_annotation_spaces", [True, False])
+def test_extract_full_text_matches_bbox(multiple_pages_file_name, include_annotation_spaces):
+    hot_pdf_object = HotPdf(multiple_pages_file_name, include_annotation_spaces=include_annotation_spaces)
+    for page in hot_pdf_object.pages:
+        assert page.extract_full_text() == page.extract_text_from_bbox(x0=0, x1=page.width, y0=0, y1=page.height)
+
+
+def test_find_text_duplicate_pages(multiple_pages_file_name):
+    hot_pdf_object = HotPdf(multiple_pages_file_name)
+    occurences = hot_pdf_object.find_text(query="God", pages=[2, 1, 2])
+    assert list(occurences) == [2, 1]
+    assert occurences[2] == hot_pdf_object.find_text(query="God", pages=[2])[2]
+
+
+def test_extract_text_float_coordinates(valid_file_name):
+    hot_pdf_object = HotPdf(valid_file_name)
+    assert hot_pdf_object.extract_text(0.4, 0, 999.2, 1000) == hot_pdf_object.extract_text(0, 0, 1000, 1000)
+
+
+def occurence_positions(occurences):
+    # span ids are generated on load, compare characters by value and position
+    return {
+        page_num: [[(ch.value, ch.x, ch.y) for ch in occurence] for occurence in page_occurences]
+        for page_num, page_occurences in occurences.items()
+    }
+
+
+def test_lazy_load(multiple_pages_file_name):
+    with patch.object(MemoryMap, "load_memory_map", autospec=True, side_effect=MemoryMap.load_memory_map) as load:
+        hot_pdf_object = HotPdf(multiple_pages_file_name, lazy=True)
+        assert len(hot_pdf_object.pages) == 20
+        assert load.call_count == 0
+
+        occurences = hot_pdf_object.find_text("God", pages=[3, 9])
+        assert load.call_count == 2
+        assert hot_pdf_object.pages.is_loaded(9)
+        assert not hot_pdf_object.pages.is_loaded(0)
+
+    eager_pdf_object = HotPdf(multiple_pages_file_name)
+    assert occurence_positions(occurences) == occurence_positions(eager_pdf_object.find_text("God", pages=[3, 9]))
+    assert any(occurences.values())
+    assert hot_pdf_object.extract_page_text(page=19) == eager_pdf_object.extract_page_text(page=19)
+    assert hot_pdf_object.pages[-1] is hot_pdf_object.pages[19]
+    assert hot_pdf_object.pages[1:3] == [hot_pdf_object.pages[1], hot_pdf_object.pages[2]]
+    with pytest.raises(IndexError):
+        hot_pdf_object.pages[20]
+
+
+def test_lazy_load_parses_once(multiple_pages_file_name):
+    with patch("hotpdf.processor.PDFParser", wraps=PDFParser) as parser:
+        hot_pdf_object = HotPdf(multiple_pages_file_name, lazy=True)
+        hot_pdf_object.build_indexes(pages=[0, 5, 19])
+    # Pages are processed from the document opened when loading
+    assert parser.call_count == 1
+
+
+@pytest.mark.parametrize("page_numbers", [[5, 1, 1], [2, 99]])
+def test_lazy_load_page_numbers(multiple_pages_file_name, page_numbers):
+    hot_pdf_object = HotPdf(multiple_pages_file_name, page_numbers=page_numbers, lazy=True)
+    eager_pdf_object = HotPdf(multiple_pages_file_name, page_numbers=page_numbers)
+    assert len(hot_pdf_object.pages) == len(eager_pdf_object.pages)
+    assert hot_pdf_object.extract_pages_text() == eager_pdf_object.extract_pages_text()
+
+
+def test_lazy_load_locked_bytes(locked_file_name):
+    with open(locked_file_name, "rb") as f:
+        hot_pdf_object = HotPdf(f, password="hotpdfiscool", lazy=True)
+        assert len(hot_pdf_object.extract_page_text(page=0)) > 500
+    with open(locked_file_name, "rb") as f, pytest.raises(PDFPasswordIncorrect):
+        HotPdf(f, lazy=True)
+
+
+def test_lazy_load_invalid(invalid_file_name):
+    with pytest.raises(PDFSyntaxError):
+        HotPdf(invalid_file_name, lazy=True)
+
+
+def test_multi_load_lazy(valid_file_name, multiple_pages_file_name):
+    big_pdf = HotPdf.merge_multiple(hotpdfs=[HotPdf(valid_file_name), HotPdf(multiple_pages_file_name, lazy=True)])
+    assert len(big_pdf.pages) == 21
+    assert "HOTPDF" in big_pdf.extract_page_text(page=0)
+
+
+def test_extract_page_text_cached(valid_file_name):
+    hot_pdf_object = HotPdf(valid_file_name)
+    page_text = hot_pdf_object.extract_page_text(page=0)
+    assert hot_pdf_object.pages[0]._full_text is page_text
+    assert hot_pdf_object.extract_page_text(page=0) is page_text
+
+
+def test_find_texts(multiple_pages_file_name):
+    queries = ["God", "the", "BLAH", "God"]
+    hot_pdf_object = HotPdf(multiple_pages_file_name)
+    occurences = hot_pdf_object.find_texts(queries, pages=[0, 8, 9], take_span=True)
+    assert list(occurences) == ["God", "the", "BLAH"]
+    for query in occurences:
+        assert occurences[query] == hot_pdf_object.find_text(query, pages=[0, 8, 9], take_span=True)
+    assert occurences["BLAH"] == {0: [], 8: [], 9: []}
+
+
+def test_build_indexes(multiple_pages_file_name):
+    hot_pdf_object = HotPdf(multiple_pages_file_name, lazy=True)
+    hot_pdf_object.build_indexes(pages=[8, 9])
+    assert hot_pdf_object.pages.is_loaded(8)
+    assert not hot_pdf_object.pages.is_loaded(0)
+
+    page = hot_pdf_object.pages[8]
+    span_index, full_text, row_index = page._span_index, page._full_text, dict(page._row_index)
+    assert span_index is not None
+    assert full_text is not None
+    assert "G" in row_index
+
+    # Searching and extracting reuse the indexes that were built up front
+    assert hot_pdf_object.find_text("God", pages=[8])[8]
+    assert hot_pdf_object.extract_spans(0, 0, 1000, 1000, page=8)
+    assert page._span_index is span_index
+    assert hot_pdf_object.extract_page_text(page=8) is full_text
+    assert page._row_index == row_index